@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from functools import partial
 import logging
 
@@ -29,6 +30,8 @@ class RasaActionServer:
         self._hass = hass
         self._port = port
         self._iface = None
+        self._server = None
+        self._task: asyncio.Task | None = None
 
         # Server settings
         self._host = "0.0.0.0"
@@ -40,7 +43,23 @@ class RasaActionServer:
         actions.register_hass(self._iface)
 
         loader = AppLoader(factory=self._create_server)
-        self._hass.async_create_background_task(self._run_server(loader), "rasa-action")
+        self._task = self._hass.async_create_background_task(
+            self._run_server(loader), "rasa-action"
+        )
+
+    async def shutdown(self) -> None:
+        """Stop the action endpoint server and release its socket."""
+        if self._iface is not None:
+            self._iface.async_unload()
+            self._iface = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            _LOGGER.info("Action endpoint server stopped")
 
     async def update(self) -> None:
         """Update HA data."""
@@ -81,6 +100,7 @@ class RasaActionServer:
         if not server:
             raise RuntimeError("Action server not created")
 
+        self._server = server
         await server.startup()
 
         _LOGGER.info(
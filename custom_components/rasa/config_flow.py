@@ -7,6 +7,9 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from aiohttp.client_exceptions import ClientError
+import rasa_client
+from rasa_client.rest import ApiException
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
@@ -21,6 +24,9 @@ from .const import CONF_ACTION_PORT, CONF_SERVER_URL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keep the config-flow connectivity probe short so a bad URL fails fast.
+VALIDATE_TIMEOUT = 2.0  # seconds
+
 # TODO adjust the data schema to the data that you need
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -32,22 +38,6 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-class PlaceholderHub:
-    """Placeholder class to make tests pass.
-
-    TODO Remove this placeholder class and replace with things from your PyPI package.
-    """
-
-    def __init__(self, url: str, port: int) -> None:
-        """Initialize."""
-        self.url = url
-        self.port = port
-
-    async def authenticate(self) -> bool:
-        """Test if we can authenticate with the host."""
-        return True
-
-
 class RasaConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Rasa NLP."""
 
@@ -64,14 +54,23 @@ class RasaConfigFlow(ConfigFlow, domain=DOMAIN):
         if self.url is None or self.port is None:
             raise CannotConnect
 
-        hub = PlaceholderHub(self.url, self.port)
-
-        # If you cannot connect:
-        # throw CannotConnect
-        # If the authentication is wrong:
-        # InvalidAuth
-        if not await hub.authenticate():
-            raise InvalidAuth
+        # ApiClient init touches the filesystem (default certs), so build it
+        # in the executor just like async_setup_entry does.
+        server_config = rasa_client.Configuration(host=self.url)
+        client = await self.hass.async_add_executor_job(
+            rasa_client.ApiClient, server_config
+        )
+        info = rasa_client.ServerInformationApi(client)
+        try:
+            rsp = await info.get_version(VALIDATE_TIMEOUT)
+        except (ApiException, ClientError) as err:
+            raise CannotConnect from err
+        finally:
+            # The probe client is only needed for this one request; close it
+            # so each form submit doesn't leak an aiohttp session.
+            await client.close()
+
+        _LOGGER.debug("Validated Rasa server version %s", rsp.version)
 
         # Return info that you want to store in the config entry.
         return {"title": "Rasa Server"}
@@ -90,8 +89,6 @@ class RasaConfigFlow(ConfigFlow, domain=DOMAIN):
                 info = await self.validate_input()
             except CannotConnect:
                 errors["base"] = "cannot_connect"
-            except InvalidAuth:
-                errors["base"] = "invalid_auth"
             except Exception:
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
@@ -108,7 +105,3 @@ class RasaConfigFlow(ConfigFlow, domain=DOMAIN):
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
-
-
-class InvalidAuth(HomeAssistantError):
-    """Error to indicate there is invalid auth."""
@@ -4,8 +4,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from itertools import islice
 import logging
 
+from aiohttp.client_exceptions import ClientError
 import rasa_client
 from rasa_client.rest import ApiException
 
@@ -33,6 +37,28 @@ from .const import DATA_RASA_ENTITY, DEFAULT_TIMEOUT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on remembered conversation IDs; oldest entries are evicted
+# first once the limit is hit.
+_MAX_KNOWN_CONVERSATIONS = 256
+
+# How long to coalesce newly-added entities before refreshing their expose
+# flags. Entities appear in storms during startup; one flush per window keeps
+# the event loop clear.
+_EXPOSE_FLUSH_DELAY = 0.1  # seconds
+
+# Tracker event fields worth echoing to the debug log, in the order they
+# should appear on the line. The metadata blob itself is deliberately omitted:
+# it is logged separately when the session is created and can be large.
+_DUMP_KEYS: tuple[str, ...] = (
+    "name",
+    "intent",
+    "confidence",
+    "policy",
+    "utter_action",
+    "value",
+    "text",
+)
+
 
 # Copied from homeassistant/components/conversation/default_agent.py
 async def async_setup_entry(
@@ -58,12 +84,28 @@ async def async_setup_entry(
     async_set_agent(hass, config_entry, agent)
 
     # TODO: unclear if the below are necessary for non-default agent
+    pending_expose: set[str] = set()
+    flush_handle: asyncio.TimerHandle | None = None
+
+    @core.callback
+    def _flush_expose() -> None:
+        """Set expose flag on all entities queued since the last flush."""
+        nonlocal flush_handle
+        flush_handle = None
+        entity_ids = pending_expose.copy()
+        pending_expose.clear()
+        for entity_id in entity_ids:
+            async_should_expose(hass, DOMAIN, entity_id)
+
     @core.callback
     def async_entity_state_listener(
         event: core.Event[core.EventStateChangedData],
     ) -> None:
-        """Set expose flag on new entities."""
-        async_should_expose(hass, DOMAIN, event.data["entity_id"])
+        """Queue new entities for an expose flag refresh."""
+        nonlocal flush_handle
+        pending_expose.add(event.data["entity_id"])
+        if flush_handle is None:
+            flush_handle = hass.loop.call_later(_EXPOSE_FLUSH_DELAY, _flush_expose)
 
     @core.callback
     def async_hass_started(hass: core.HomeAssistant) -> None:
@@ -105,6 +147,9 @@ class RasaAgent(ConversationEntity, AbstractConversationAgent):
         )
         self._last_ts = 0.0
         self._device_registry = dr.async_get(hass)
+        # Conversations we have already initialized on the Rasa server,
+        # kept as a small LRU so the set stays bounded.
+        self._known_conv_ids: OrderedDict[str, None] = OrderedDict()
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to Home Assistant."""
@@ -116,7 +161,10 @@ class RasaAgent(ConversationEntity, AbstractConversationAgent):
 
     async def async_will_remove_from_hass(self) -> None:
         """When entity will be removed from Home Assistant."""
-        async_unset_agent(self.hass, self.entry)
+        # Tear down the action server so config entry reloads don't leak the
+        # listening socket and its background task.
+        await self._action_server.shutdown()
+        async_unset_agent(self.hass, self._entry)
         await super().async_will_remove_from_hass()
 
     @property
@@ -136,49 +184,52 @@ class RasaAgent(ConversationEntity, AbstractConversationAgent):
         Called during server startup. Does not contain any information about whether
         the service is actually used by an assistant.
         """
+        # The action server launch is independent of the Rasa server info
+        # queries, so run all three concurrently; setup latency is the max of
+        # the three rather than their sum.
         try:
-            rsp_ver = await self._server_info_api.get_version(DEFAULT_TIMEOUT)
-            _LOGGER.info("Connected to Rasa server version %s", rsp_ver.version)
-            self._attr_device_info["sw_version"] = rsp_ver.version
-            rsp_stat = await self._server_info_api.get_status(DEFAULT_TIMEOUT)
-            _LOGGER.info(
-                "Rasa server running model %s at %s",
-                rsp_stat.model_id,
-                rsp_stat.model_file,
+            _, rsp_ver, rsp_stat = await asyncio.gather(
+                self._action_server.launch(),
+                self._server_info_api.get_version(DEFAULT_TIMEOUT),
+                self._server_info_api.get_status(DEFAULT_TIMEOUT),
             )
-            # Specify the model file as the hardware version. We don't have a perfect
-            # way of communicating the model info, but this is close enough.
-            self._attr_device_info["hw_version"] = rsp_stat.model_file
-        except ApiException as ex:
+        except (ApiException, ClientError) as ex:
+            # The gather launches the action server unconditionally; tear it
+            # down before failing setup, or the orphaned server would hold the
+            # port (and its HassIface listeners) with no entity to remove it.
+            await self._action_server.shutdown()
             raise IntegrationError from ex
 
-        await self._action_server.launch()
+        _LOGGER.info("Connected to Rasa server version %s", rsp_ver.version)
+        self._attr_device_info["sw_version"] = rsp_ver.version
+        _LOGGER.info(
+            "Rasa server running model %s at %s",
+            rsp_stat.model_id,
+            rsp_stat.model_file,
+        )
+        # Specify the model file as the hardware version. We don't have a perfect
+        # way of communicating the model info, but this is close enough.
+        self._attr_device_info["hw_version"] = rsp_stat.model_file
 
     def _dump_tracker_evts(self, tracker: rasa_client.Tracker | None):
         if tracker and tracker.events:
             for ev in tracker.events:
-                if ev.actual_instance.timestamp <= self._last_ts:
+                inst = ev.actual_instance
+                if inst.timestamp <= self._last_ts:
                     continue
-                self._last_ts = ev.actual_instance.timestamp
-                data = ev.to_dict()
-                # Flatten
-                data.update(data["metadata"])
-                pairs = [
-                    f"{k}={v}"
-                    for k, v in data.items()
-                    if k
-                    in (
-                        "name",
-                        "value",
-                        "utter_action",
-                        "policy",
-                        "confidence",
-                        "text",
-                        "intent",
-                        "metadata",
-                    )
-                ]
-                _LOGGER.debug("-- %s evt: %s", data["event"], " ".join(pairs))
+                self._last_ts = inst.timestamp
+                # Read the handful of fields we log directly off the model.
+                # to_dict() walks and serializes every field of the event just
+                # so we can flatten the metadata and pick out a few keys.
+                metadata = getattr(inst, "metadata", None) or {}
+                pairs = []
+                for k in _DUMP_KEYS:
+                    v = getattr(inst, k, None)
+                    if v is None:
+                        v = metadata.get(k)
+                    if v is not None:
+                        pairs.append(f"{k}={v}")
+                _LOGGER.debug("-- %s evt: %s", inst.event, " ".join(pairs))
 
     # This is where the actual conversation entity functionality is
     async def _async_handle_message(
@@ -201,7 +252,9 @@ class RasaAgent(ConversationEntity, AbstractConversationAgent):
         # to go about this as it predicts and executes actions immediately.
         # Alternatively it looks like `addConversationTrackerEvents` will automatically
         # create a new session if needed.
-        if len(chat_log.content) == 2:  # TODO: HACK
+        # Track session identity ourselves rather than inferring it from the
+        # shape of chat_log.content, which is an HA implementation detail.
+        if conv_id not in self._known_conv_ids:
             # Refresh entities, devices, and locations from HA
             await self._action_server.update()
 
@@ -236,14 +289,15 @@ class RasaAgent(ConversationEntity, AbstractConversationAgent):
             # If we fake the session start events, we only get "action_listen" events
             # during prediction. The debug log seems to indicate the processor is
             # in "state 0" instead of "state 1" as it is during successful operation.
+            # Build the SlotEvent directly rather than round-tripping a dict
+            # literal through from_dict(). Only the metadata value varies per
+            # session and it is shared by reference, not copied.
             events = [
                 rasa_client.Event(
-                    rasa_client.SlotEvent.from_dict(
-                        {
-                            "event": "slot",
-                            "name": "session_started_metadata",
-                            "value": metadata,
-                        }
+                    rasa_client.SlotEvent(
+                        event="slot",
+                        name="session_started_metadata",
+                        value=metadata,
                     )
                 ),
             ]
@@ -253,8 +307,16 @@ class RasaAgent(ConversationEntity, AbstractConversationAgent):
                 conversation_id=conv_id,
                 add_conversation_tracker_events_request=msg_req,
             )
+
+            self._known_conv_ids[conv_id] = None
+            if len(self._known_conv_ids) > _MAX_KNOWN_CONVERSATIONS:
+                self._known_conv_ids.popitem(last=False)
         else:
-            _LOGGER.debug("Chat log so far: %s", chat_log)
+            self._known_conv_ids.move_to_end(conv_id)
+            # chat_log's repr can be large; don't build the log record at all
+            # unless debug output is actually wanted.
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Chat log so far: %s", chat_log)
 
         _LOGGER.info("-> message")
         tracker = await self._tracker_api.add_conversation_message(
@@ -279,11 +341,12 @@ class RasaAgent(ConversationEntity, AbstractConversationAgent):
             predict_result = await self._tracker_api.predict_conversation_action(
                 conversation_id=conv_id
             )
-            if predict_result.scores:
-                for score in predict_result.scores[:5]:
-                    _LOGGER.debug("<- %f: %s", score.score, score.action)
-            else:
+            if not predict_result.scores:
                 raise IntegrationError("Received empty prediction result from server")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                # islice avoids the [:5] slice allocation per prediction
+                for score in islice(predict_result.scores, 5):
+                    _LOGGER.debug("<- %f: %s", score.score, score.action)
 
             self._dump_tracker_evts(predict_result.tracker)
 
@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
 from collections.abc import Iterable
+from itertools import chain
 import logging
-from operator import attrgetter
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 
 import voluptuous as vol
@@ -16,15 +19,13 @@ from homeassistant.components.climate import (
     SERVICE_SET_HUMIDITY,
     SERVICE_SET_TEMPERATURE,
 )
-from homeassistant.components.device_automation import (
-    DeviceAutomationType,
-    async_get_device_automations,
-)
 from homeassistant.components.homeassistant import async_should_expose
+from homeassistant.components.homeassistant.exposed_entities import (
+    async_listen_entity_updates,
+)
 from homeassistant.components.media_player import SERVICE_VOLUME_SET
 from homeassistant.const import (
     CONF_ENTITY_ID,
-    CONF_TYPE,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
 )
@@ -54,6 +55,30 @@ INTERESTING_ATTRIBUTES = {
     "media_album_name",
 }
 
+# Per-domain subsets of INTERESTING_ATTRIBUTES. Most domains only ever expose
+# a few of the interesting names, so probing these against state.attributes
+# beats scanning every attribute key; unknown domains fall back to the full
+# set.
+_DOMAIN_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "light": ("brightness",),
+    "climate": (
+        "temperature",
+        "current_temperature",
+        "temperature_unit",
+        "humidity",
+    ),
+    "humidifier": ("humidity",),
+    "cover": ("current_position",),
+    "fan": ("percentage",),
+    "sensor": ("unit_of_measurement",),
+    "media_player": (
+        "volume_level",
+        "media_title",
+        "media_artist",
+        "media_album_name",
+    ),
+}
+
 # Some of the above are not named the way a person would name then when talking.
 # Map the informal language to the HA attribute name.
 ATTRIBUTE_MAP = {
@@ -64,6 +89,27 @@ ATTRIBUTE_MAP = {
     "album_name": "media_album_name",
 }
 
+# Ugh. Heuristic. May need adjustment. What a mess. See e.g.
+# homeassistant/components/alexa/handlers.py:async_api_set_range() for what
+# other assistants have done. Maybe re-use some of that.
+_PARAM_TO_SVC = MappingProxyType(
+    {
+        "temperature": SERVICE_SET_TEMPERATURE,
+        "humidity": SERVICE_SET_HUMIDITY,
+        "volume_level": SERVICE_VOLUME_SET,
+        # "mode" can refer to a variety of things depending on domain. Don't try to
+        # set that (yet)
+    }
+)
+
+# Sentinel distinguishing "attribute missing" from an attribute stored as None.
+_MISSING = object()
+
+# Shared empty action set and short-spelling index for domains that register
+# no services.
+_NO_ACTIONS: frozenset[str] = frozenset()
+_NO_ACTION_SHORTS = MappingProxyType({})
+
 
 async def _get_areas(
     hass: core.HomeAssistant, area_ids: Iterable[Any]
@@ -86,12 +132,16 @@ async def _get_areas(
         area_names = [area.name.lower()]
         area_names.extend(a.lower() for a in area.aliases)
         areas[area_id] = {
+            "id": area_id,
             "names": area_names,
             "floor_id": area.floor_id,
         }
 
         if area.floor_id:
-            if area.floor_id not in floors:
+            # One probe instead of a membership test plus an index; setdefault
+            # would work too but would build the name list even on hits.
+            floor_info = floors.get(area.floor_id)
+            if floor_info is None:
                 floor = floor_reg.async_get_floor(area.floor_id)
                 if floor is None:
                     continue
@@ -99,9 +149,12 @@ async def _get_areas(
                 floor_names = [floor.name.lower()]
                 floor_names.extend(a.lower() for a in floor.aliases)
 
-                floors[area.floor_id] = {"names": floor_names, "area_ids": [area_id]}
-            else:
-                floors[area.floor_id]["area_ids"].append(area_id)
+                floor_info = floors[area.floor_id] = {
+                    "id": area.floor_id,
+                    "names": floor_names,
+                    "area_ids": [],
+                }
+            floor_info["area_ids"].append(area_id)
 
     return areas, floors
 
@@ -130,7 +183,10 @@ async def _get_exposed_entities(
     device_registry = dr.async_get(hass)
 
     entities = {}
-    entities_by_area: dict[str, list[str]] = {}
+    # Accumulate as sets: an entity can reach the same area through both its
+    # own area and its device's area, and duplicates would otherwise leak into
+    # the per-area and per-floor entity lists.
+    entities_by_area: defaultdict[str, set[str]] = defaultdict(set)
 
     _LOGGER.debug("Checking all entities for exposure to %s", assistant)
 
@@ -138,112 +194,136 @@ async def _get_exposed_entities(
     # DO NOT MODIFY THIS DICT! We are using it in-place for efficiency.
     svcs = hass.services.async_services_internal()
     # TODO: we are throwing away schema information here
-    actions = {d: tuple(s.keys()) for d, s in svcs.items()}
-
-    for state in sorted(hass.states.async_all(), key=attrgetter("name")):
-        if not async_should_expose(hass, assistant, state.entity_id):
+    # One frozenset per domain, shared by reference across every entity of
+    # that domain: membership tests in _match_actions become O(1).
+    actions = {d: frozenset(s.keys()) for d, s in svcs.items()}
+
+    # A generic action like "stop" can be implemented as "stop_cover" for the
+    # cover class or "media_stop" for the media player class. Reverse each
+    # domain's services into short spelling -> canonical names once here so
+    # _match_actions is a dict lookup per requested action instead of trying
+    # every spelling per entity. Shared by reference like the action sets.
+    actions_by_short: dict[str, dict[str, tuple[str, ...]]] = {}
+    for d, acts in actions.items():
+        prefix = f"{d}_"
+        suffix = f"_{d}"
+        by_short: dict[str, list[str]] = {}
+        for svc in acts:
+            by_short.setdefault(svc, []).append(svc)
+            if svc.endswith(suffix):
+                by_short.setdefault(svc[: -len(suffix)], []).append(svc)
+            if svc.startswith(prefix):
+                by_short.setdefault(svc[len(prefix) :], []).append(svc)
+        actions_by_short[d] = {k: tuple(v) for k, v in by_short.items()}
+
+    # Bind hot lookups to locals; each would otherwise be re-resolved once per
+    # state in the loop below.
+    should_expose = async_should_expose
+    ent_get = entity_registry.async_get
+    dev_get = device_registry.async_get
+    interesting = INTERESTING_ATTRIBUTES
+    domain_attrs = _DOMAIN_ATTRIBUTES
+
+    # Results land in dicts, so no ordering is needed; a single unsorted pass
+    # avoids materializing and sorting a list of every exposed state.
+    for state in hass.states.async_all():
+        if not should_expose(hass, assistant, state.entity_id):
             continue
-
-        entity_entry = entity_registry.async_get(state.entity_id)
+        entity_entry = ent_get(state.entity_id)
         names = [state.name.lower()]
         area_ids = []
 
         if entity_entry is not None:
             names.extend(a.lower() for a in entity_entry.aliases)
-            if entity_entry.area_id:
-                # Entity is in area
-                area_ids.append(entity_entry.area_id)
-                if entity_entry.area_id not in entities_by_area:
-                    entities_by_area[entity_entry.area_id] = [state.entity_id]
-                else:
-                    entities_by_area[entity_entry.area_id].append(state.entity_id)
-            if entity_entry.device_id and (
-                device := device_registry.async_get(entity_entry.device_id)
+            device = (
+                dev_get(entity_entry.device_id) if entity_entry.device_id else None
+            )
+            # An entity commonly shares its device's area; one loop records
+            # each area exactly once instead of two mirrored branches. The
+            # list holds at most two entries, so the membership test is cheap.
+            for aid in (
+                entity_entry.area_id,
+                device.area_id if device else None,
             ):
-                # Check device area
-                if device.area_id:
-                    area_ids.append(device.area_id)
-                    if device.area_id not in entities_by_area:
-                        entities_by_area[device.area_id] = [state.entity_id]
-                    else:
-                        entities_by_area[device.area_id].append(state.entity_id)
-
-                # TODO:
-                # async_get_device_automations returns something that isn't the services
-                # associated with the entity and isn't what's listed for "automations" in
-                # the web UI. It's unclear exactly what the distinction is between
-                # async_get_device_automations and services. Instead, we query all services
-                # registered to each domain and reference those instead.
+                if aid and aid not in area_ids:
+                    area_ids.append(aid)
+                    entities_by_area[aid].add(state.entity_id)
+
+            # TODO:
+            # async_get_device_automations returns something that isn't the services
+            # associated with the entity and isn't what's listed for "automations" in
+            # the web UI. It's unclear exactly what the distinction is between
+            # async_get_device_automations and services. Instead, we query all services
+            # registered to each domain and reference those instead.
 
             info: dict[str, Any] = {
+                "id": state.entity_id,
                 "names": names,
                 "domain": state.domain,
                 "platform": entity_entry.platform,
-                "area_ids": area_ids,
+                "area_ids": tuple(area_ids),
                 # Some entities have no actions, like read-only sensors
-                "action": actions.get(state.domain, []),
+                "action": actions.get(state.domain, _NO_ACTIONS),
+                "action_by_short": actions_by_short.get(
+                    state.domain, _NO_ACTION_SHORTS
+                ),
             }
 
-            info["attributes"] = [
-                attr_name
-                for attr_name in state.attributes
-                if attr_name in INTERESTING_ATTRIBUTES
-            ]
+            # Probe the few attribute names this domain can expose against the
+            # (often much larger) attribute dict instead of scanning every
+            # attribute key. Stored as a frozenset so match_entities can union
+            # and intersect it at C speed.
+            attrs = domain_attrs.get(state.domain, interesting)
+            ent_attrs = frozenset(a for a in attrs if a in state.attributes)
 
             # HACK:
             # Just pretend media players have a volume even though all the adjustments
             # are done through special service calls.
             if state.domain in ("media_player", "remote"):
-                info["attributes"].append("volume_level")
+                ent_attrs |= {"volume_level"}
+            info["attributes"] = ent_attrs
 
             # _LOGGER.debug("Entity %s: %s", state.entity_id, info)
             entities[state.entity_id] = info
 
     areas, floors = await _get_areas(hass, entities_by_area.keys())
     for area_id, ent in entities_by_area.items():
-        areas[area_id]["entity_ids"] = ent
-    # Calculate all entities on floor by accumulating all entites in all areas.
-    for floor in floors.values():
-        floor["entity_ids"] = []
-        for area_id in floor["area_ids"]:
-            floor["entity_ids"].extend(areas[area_id]["entity_ids"])
+        areas[area_id]["entity_ids"] = frozenset(ent)
+    # Floor entity lists are accumulated lazily on first use; see
+    # HassIface._floor_entity_ids.
 
     return entities, areas, floors
 
 
-def _reverse_map(map: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    """Reverse a dictionary of name lists."""
+def _index_by_name(by_id: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index records under each of their names and aliases.
+
+    The records already carry their own "id", so the same dicts are shared
+    between the by-ID and by-name maps; nothing is copied. setdefault merges
+    the collision probe and the insert into a single lookup.
+    """
     result: dict[str, dict[str, Any]] = {}
 
-    for k, v in map.items():
-        # Create copy
-        val = dict(v)
-        names = val.pop("names", [])
-        val["id"] = k
-        for name in names:
-            # Note that we are using the identical `val` here so there are multiple
-            # references to the same value dictionary.
-            if name in result:
+    for val in by_id.values():
+        for name in val["names"]:
+            if result.setdefault(name, val) is not val:
                 _LOGGER.warning(
                     "Key collision: The name %s already refers to an object. Control may be impaired",
                     name,
                 )
-            result[name] = val
 
     return result
 
 
-class SdkArgs:
-    """Helper class for passing arguments to SDK action server."""
+class SdkArgs(SimpleNamespace):
+    """Helper class for passing arguments to SDK action server.
 
-    def __init__(self, **kwargs) -> None:
-        """Initialize the object with any desired attributes."""
-        self._data = kwargs
+    Attributes that were set resolve through the instance __dict__ at C speed;
+    __getattr__ only fires for truly missing names.
+    """
 
     def __getattr__(self, name: str):
-        """Retrieve any set attributes or None without raising."""
-        if name in self._data:
-            return self._data[name]
+        """Return None for any attribute that was not set, without raising."""
         return None
 
 
@@ -253,31 +333,118 @@ class HassIface:
     def __init__(self, hass: core.HomeAssistant) -> None:
         """Initialize the action server."""
         self._hass = hass
+        # Loaded data is cached; registry changes mark it dirty so the next
+        # load() rebuilds instead of recomputing on every call.
+        self._dirty = True
+        # Keep the unsubscribe callbacks: a new HassIface is built on every
+        # config-entry setup, so the listeners (and the maps they keep alive)
+        # would leak across reloads otherwise.
+        self._unsubs: list[core.CALLBACK_TYPE] = [
+            hass.bus.async_listen(event_type, self._async_registry_updated)
+            for event_type in (
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                ar.EVENT_AREA_REGISTRY_UPDATED,
+                fr.EVENT_FLOOR_REGISTRY_UPDATED,
+            )
+        ]
+        # Exposure settings live outside the registries; without this listener
+        # the cache would keep serving entities the user has since hidden.
+        self._unsubs.append(
+            async_listen_entity_updates(
+                hass, "conversation", self._async_exposure_updated
+            )
+        )
         # These are dictionaries mapping the object ID to the relevant object info.
         self._entity_by_id: dict[str, dict[str, Any]] = {}
         self._area_by_id: dict[str, dict[str, Any]] = {}
         self._floor_by_id: dict[str, dict[str, Any]] = {}
+        # Areas and floors merged into one map so an ID lookup is a single
+        # probe; the records are shared with the per-kind maps above.
+        self._loc_by_id: dict[str, dict[str, Any]] = {}
         # These are the same as above, but the key is by object name. Aliases are
         # also present as keys.
         self._entity_by_name: dict[str, dict[str, Any]] = {}
         self._area_by_name: dict[str, dict[str, Any]] = {}
         self._floor_by_name: dict[str, dict[str, Any]] = {}
+        # Combined name -> [(kind, info), ...] index over areas and floors so
+        # location lookups are a single hash probe.
+        self._location_by_name: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        # Inverted indices over entities, rebuilt by load(): token -> entity
+        # IDs carrying that name/attribute. Names include the entity's domain
+        # so a device slot like "light" matches the whole domain.
+        self._ents_by_name: dict[str, set[str]] = {}
+        self._ents_by_attr: dict[str, set[str]] = {}
+        self._ents_with_actions: set[str] = set()
 
         # Server settings
         self._host = "0.0.0.0"
         self._protocol = "http"
 
+    @core.callback
+    def async_unload(self) -> None:
+        """Detach the invalidation listeners registered at init."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    @core.callback
+    def _async_registry_updated(self, event: core.Event) -> None:
+        """Invalidate the cached entity data on a registry change."""
+        self._dirty = True
+
+    @core.callback
+    def _async_exposure_updated(self) -> None:
+        """Invalidate the cached entity data when exposure settings change."""
+        self._dirty = True
+
     async def load(self) -> None:
-        """Load entities."""
+        """Load entities.
+
+        The registries change rarely, so the rebuilt maps are kept until a
+        registry event invalidates them.
+        """
+        if not self._dirty and self._entity_by_id:
+            return
+
         (
             self._entity_by_id,
             self._area_by_id,
             self._floor_by_id,
         ) = await _get_exposed_entities(self._hass)
+        # Areas last so they win when an ID is both an area and a floor,
+        # matching the area-first probe order this map replaced.
+        self._loc_by_id = {**self._floor_by_id, **self._area_by_id}
         # Remap by names
-        self._entity_by_name = _reverse_map(self._entity_by_id)
-        self._area_by_name = _reverse_map(self._area_by_id)
-        self._floor_by_name = _reverse_map(self._floor_by_id)
+        self._entity_by_name = _index_by_name(self._entity_by_id)
+        self._area_by_name = _index_by_name(self._area_by_id)
+        self._floor_by_name = _index_by_name(self._floor_by_id)
+
+        location_by_name: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for name, area in self._area_by_name.items():
+            location_by_name[name] = [("area", area)]
+        for name, floor in self._floor_by_name.items():
+            location_by_name.setdefault(name, []).append(("floor", floor))
+        self._location_by_name = location_by_name
+
+        # Inverted indices for the match path: each slot filter then becomes a
+        # union/intersection of entity-ID sets instead of a per-entity scan.
+        ents_by_name: dict[str, set[str]] = {}
+        ents_by_attr: dict[str, set[str]] = {}
+        ents_with_actions: set[str] = set()
+        for eid, ent in self._entity_by_id.items():
+            for name in ent["names"]:
+                ents_by_name.setdefault(name, set()).add(eid)
+            ents_by_name.setdefault(ent["domain"], set()).add(eid)
+            for attr in ent["attributes"]:
+                ents_by_attr.setdefault(attr, set()).add(eid)
+            if ent["action"]:
+                ents_with_actions.add(eid)
+        self._ents_by_name = ents_by_name
+        self._ents_by_attr = ents_by_attr
+        self._ents_with_actions = ents_with_actions
+
+        self._dirty = False
 
         actions = set()
         for ent in self._entity_by_id.values():
@@ -290,11 +457,12 @@ class HassIface:
 
     def get_location_by_id(self, loc_id: str) -> str:
         """Get the location name for the location ID."""
-        if loc_id in self._area_by_id:
-            return self._area_by_id[loc_id]
-        if loc_id in self._floor_by_id:
-            return self._floor_by_id[loc_id]
-        raise IndexError(f"Location ID {loc_id} matches no known location")
+        try:
+            return self._loc_by_id[loc_id]
+        except KeyError:
+            raise IndexError(
+                f"Location ID {loc_id} matches no known location"
+            ) from None
 
     def get_entity_by_id(self, ent_id: str) -> str:
         """Get the device name for the device ID."""
@@ -302,97 +470,113 @@ class HassIface:
 
     def _get_area_ids(self, location: str) -> list[str]:
         """Check floors and areas to find all area IDs compatible with this location name."""
-        if location in self._floor_by_name:
-            # If the location is a floor, include all areas on that floor
-            return self._floor_by_name[location]["area_ids"]
+        hits = self._location_by_name.get(location)
+        if hits is None:
+            # No locations found
+            raise ValueError(f"Location {location} not found")
 
-        if location in self._area_by_name:
-            # Not a floor but is an area name
-            return [self._area_by_name[location]["id"]]
+        for kind, val in hits:
+            if kind == "floor":
+                # If the location is a floor, include all areas on that floor
+                return val["area_ids"]
 
-        # No locations found
-        raise ValueError(f"Location {location} not found")
+        # Not a floor but is an area name
+        return [hits[0][1]["id"]]
 
     @staticmethod
     def _match_actions(entity: dict[str, Any], actions: list[str]) -> set[str]:
         """Determine whether this action can be performed on this entity.
 
-        Returns the canonical action name if a match is found.
+        Returns the canonical action names if a match is found. The short
+        spelling index is precomputed per domain in _get_exposed_entities, so
+        matching is one dict lookup per requested action.
         """
         valid_actions = set()
+        by_short = entity["action_by_short"]
         for action in actions:
-            domain = entity["domain"]
-            # A generic action like "stop" can be implemented as "stop_cover" for
-            # the cover class or "media_stop" for the media player class. This heuristic
-            # tries both to try to find a match.
-            action_candidates = [action, f"{action}_{domain}", f"{domain}_{action}"]
-            for c in action_candidates:
-                if c in entity["action"]:
-                    valid_actions.add(c)
+            hits = by_short.get(action)
+            if hits:
+                valid_actions.update(hits)
 
         return valid_actions
 
-    def _entity_is_candidate(
+    def _filter_entities(
         self,
-        entity_id: str,
-        entity_names: list[str],
-        attributes: list[str],
+        entity_names: frozenset[str],
+        attributes: frozenset[str],
         actions: list[str],
-    ) -> bool:
-        """Determine whether the entity matches the list of specified names or attributes.
+    ) -> set[str] | None:
+        """Compute the entity IDs allowed by the name/attribute/action filters.
 
-        Only check entity names and attributes if the corresponding parameter is populated.
+        Returns None when no filter is populated, meaning every entity is a
+        candidate. Each populated filter resolves through the inverted indices
+        built in load(), so filtering is a handful of C-level set operations
+        rather than a per-entity Python predicate.
         """
-        entity = self._entity_by_id[entity_id]
+        candidates: set[str] | None = None
 
-        if (
-            entity_names
-            and all(name not in entity_names for name in entity["names"])
-            and entity["domain"] not in entity_names
-        ):
-            # entity_names is populated but this entity's name and domain both do not match
-            return False
+        # Cheapest filter first: the has-actions set already exists (no union
+        # to build) and rejects read-only sensors immediately. Bail out as
+        # soon as the intersection goes empty so later unions aren't built.
+        if actions:
+            # Don't check specific actions here since we don't have a way of
+            # setting the coerced action; the entity just needs some action.
+            candidates = set(self._ents_with_actions)
+            if not candidates:
+                return candidates
 
         if attributes:
-            if entity["attributes"]:
-                if all(attr not in attributes for attr in entity["attributes"]):
-                    # attributes are populated and this entity has attributes, but none of
-                    # them match the desired list.
-                    return False
-            else:
-                # attributes specified but this entity has no attributes. Consider this not a match.
-                return False
+            hits: set[str] = set()
+            for attr in attributes:
+                hits.update(self._ents_by_attr.get(attr, ()))
+            candidates = hits if candidates is None else candidates & hits
+            if not candidates:
+                return candidates
 
-        if actions:
-            # Don't check actions here since we don't have a way of setting
-            # the coerced action.
-            if not entity["action"]:
-                # specific action requested but device has no actions
-                return False
+        if entity_names:
+            hits = set()
+            for name in entity_names:
+                hits.update(self._ents_by_name.get(name, ()))
+            candidates = hits if candidates is None else candidates & hits
 
-        # We weren't able to filter this entity away
-        return True
+        return candidates
 
     def find_location_by_name(self, loc: str) -> list[str] | None:
         """Return the location IDs with the specified name."""
         # If a location name matches both floor and area, use both IDs.
+        return [v["id"] for _, v in self._location_by_name.get(loc, ())]
 
-        ret = []
-        if loc in self._area_by_name:
-            ret.append(self._area_by_name[loc]["id"])
-        if loc in self._floor_by_name:
-            ret.append(self._floor_by_name[loc]["id"])
-        return ret
+    def _floor_entity_ids(self, floor: dict[str, Any]) -> frozenset[str]:
+        """Return all entity IDs on a floor, accumulating them on first use.
 
-    def _get_entities_by_area(self, area_id: str) -> list[str]:
-        """Get all entity IDs in floors or areas with the given ID."""
-        res: list[str] = []
-        if area_id in self._area_by_id:
-            res.extend(self._area_by_id[area_id]["entity_ids"])
-        if area_id in self._floor_by_id:
-            res.extend(self._floor_by_id[area_id]["entity_ids"])
+        Utterances typically reference only a subset of floors, so the
+        per-floor entity set is built from the floor's areas on demand and
+        cached on the floor record.
+        """
+        entity_ids = floor.get("entity_ids")
+        if entity_ids is None:
+            entity_ids = frozenset(
+                chain.from_iterable(
+                    self._area_by_id[area_id]["entity_ids"]
+                    for area_id in floor["area_ids"]
+                )
+            )
+            floor["entity_ids"] = entity_ids
+        return entity_ids
 
-        return res
+    def _get_entities_by_area(self, area_id: str) -> frozenset[str]:
+        """Get all entity IDs in floors or areas with the given ID."""
+        area = self._area_by_id.get(area_id)
+        floor = self._floor_by_id.get(area_id)
+        # An ID is almost never both an area and a floor; return the stored
+        # set directly in the single-hit cases rather than copying it.
+        if area is not None and floor is None:
+            return area["entity_ids"]
+        if floor is not None and area is None:
+            return self._floor_entity_ids(floor)
+        if area is not None and floor is not None:
+            return area["entity_ids"] | self._floor_entity_ids(floor)
+        return frozenset()
 
     def match_entities(
         self, slots: dict[str, Any]
@@ -414,8 +598,10 @@ class HassIface:
 
         # Location slot must be location ID at this stage.
         if slots["location"] is None or not slots["location"]:
-            # If no locations specified, use all locations.
-            area_ids = set(self._area_by_id.keys())
+            # If no locations specified, match against all entities directly
+            # rather than re-discovering each one through every area that
+            # contains it.
+            area_ids = None
         elif isinstance(slots["location"], str):
             area_ids = {
                 slots["location"],
@@ -432,8 +618,10 @@ class HassIface:
         else:
             attr_list = slots["parameter"]
 
-        # Map common language to formal attribute names
-        attributes = [ATTRIBUTE_MAP.get(a, a) for a in attr_list]
+        # Map common language to formal attribute names. Build the filter sets
+        # once here rather than once per candidate entity.
+        attributes = frozenset(ATTRIBUTE_MAP.get(a, a) for a in attr_list)
+        device_names = frozenset(slots["device"] or ())
 
         if isinstance(slots["action"], str):
             actions = [slots["action"]]
@@ -458,55 +646,86 @@ class HassIface:
         matching_areas = set()
         matching_attributes = set()
         matching_actions = set()
-        for area_id in area_ids:
-            for entity_id in self._get_entities_by_area(area_id):
-                if self._entity_is_candidate(
-                    entity_id, slots["device"], attributes, actions
-                ):
-                    entity = self._entity_by_id[entity_id]
-
-                    # Actions work very similarly to parameters but the naming is much
-                    # less regular. Check actions first because we may still decide to ignore
-                    # this entity if no actions match.
-                    if actions:
-                        # Only add matching actions
-                        ent_actions = self._match_actions(entity, actions)
-                        # if no actions match, don't add entity unless the user wants to set
-                        # an attribute.
-                        if not ent_actions and not is_adjust:
-                            _LOGGER.debug(
-                                "Skipping %s because no actions match %s",
-                                entity_id,
-                                actions,
-                            )
-                            continue
-                        matching_actions.update(ent_actions)
-                    else:
-                        # Accumulate all actions for matching entities
-                        matching_actions.update(entity["action"])
-
-                    if attributes:
-                        # Only add matching parameters if parameters were specified.
-                        matching_attributes.update(
-                            a for a in entity["attributes"] if a in attributes
+        candidate_ids = self._filter_entities(device_names, attributes, actions)
+        # The per-candidate argument tuples are only worth building when debug
+        # logging is actually on; check once rather than inside the loop.
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Bind hot lookups to locals; each would otherwise be re-resolved once
+        # per candidate in the loop below.
+        entity_by_id = self._entity_by_id
+        get_by_area = self._get_entities_by_area
+        if area_ids is None:
+            # A populated filter already names the exact hits; otherwise every
+            # entity is a candidate.
+            candidates: Iterable[str] = (
+                entity_by_id if candidate_ids is None else candidate_ids
+            )
+        else:
+            # Deduplicate up front: an entity can reach the pool through both
+            # an area and that area's floor (or through its own and its
+            # device's area) and would otherwise be processed twice.
+            pool: set[str] = set()
+            for aid in area_ids:
+                pool |= get_by_area(aid)
+            candidates = pool if candidate_ids is None else pool & candidate_ids
+        for entity_id in candidates:
+            entity = entity_by_id[entity_id]
+
+            # Actions work very similarly to parameters but the naming is much
+            # less regular. Check actions first because we may still decide to ignore
+            # this entity if no actions match.
+            if actions:
+                # Only add matching actions
+                ent_actions = self._match_actions(entity, actions)
+                # if no actions match, don't add entity unless the user wants to set
+                # an attribute.
+                if not ent_actions and not is_adjust:
+                    if debug_enabled:
+                        _LOGGER.debug(
+                            "Skipping %s because no actions match %s",
+                            entity_id,
+                            actions,
                         )
-                    else:
-                        # If no parameters were specified, collect all attributes
-                        # of matching entities.
-                        matching_attributes.update(entity["attributes"])
+                    continue
+                matching_actions |= ent_actions
+            else:
+                # Accumulate all actions for matching entities
+                matching_actions |= entity["action"]
 
-                    matching_areas.add(area_id)
-                    matching_entities.add(entity_id)
+            if attributes:
+                # Only add matching parameters if parameters were specified.
+                matching_attributes |= entity["attributes"] & attributes
+            else:
+                # If no parameters were specified, collect all attributes
+                # of matching entities.
+                matching_attributes |= entity["attributes"]
+
+            if area_ids is None:
+                matching_areas.update(entity["area_ids"])
+            matching_entities.add(entity_id)
+
+        if area_ids is not None:
+            # Attribute matches back to the requested locations in one pass
+            # instead of tracking the source area per candidate.
+            matching_areas = {
+                aid
+                for aid in area_ids
+                if not matching_entities.isdisjoint(get_by_area(aid))
+            }
 
         return matching_actions, matching_areas, matching_entities, matching_attributes
 
-    async def _apply_abs_adjustment(
+    def _resolve_abs_adjustment(
         self,
         parameter: str,
         amount: Any,
         state: core.State,
-    ):
-        """Make the requested adjustment to the specified device. State must be pre-filled.
+    ) -> tuple[str, dict[str, Any]]:
+        """Determine the service call that applies the requested adjustment.
+
+        Returns (service, service_data) without the entity ID so the caller
+        can group devices that resolve to an identical call. State must be
+        pre-filled.
 
         Note that this method can tolerate the device not having the attribute present. If
         the attribute is missing, we allow changing the state to on or off based on the intended
@@ -516,7 +735,7 @@ class HassIface:
         # By default assume we don't need to change the state.
         new_state = state.state
 
-        service_data = {CONF_ENTITY_ID: state.entity_id}
+        service_data: dict[str, Any] = {}
         if parameter in ("volume_level"):
             # HACK: volume_level doesn't exist in attributes for SOME REASON.
             threshold = 1
@@ -539,19 +758,8 @@ class HassIface:
         # not actually change the device. Instead, we need to call the appropriate
         # service based on the parameter being changed.
 
-        # Ugh. Heuristic. May need adjustment. What a mess. See e.g.
-        # homeassistant/components/alexa/handlers.py:async_api_set_range() for what
-        # other assistants have done. Maybe re-use some of that.
-        PARAM_TO_SVC = {
-            "temperature": SERVICE_SET_TEMPERATURE,
-            "humidity": SERVICE_SET_HUMIDITY,
-            "volume_level": SERVICE_VOLUME_SET,
-            # "mode" can refer to a variety of things depending on domain. Don't try to
-            # set that (yet)
-        }
-
-        if parameter in PARAM_TO_SVC:
-            svc = PARAM_TO_SVC[parameter]
+        if parameter in _PARAM_TO_SVC:
+            svc = _PARAM_TO_SVC[parameter]
         elif new_state == "on":
             svc = SERVICE_TURN_ON
         elif new_state == "off":
@@ -559,13 +767,7 @@ class HassIface:
         else:
             raise ValueError(f"I don't know how to adjust the {parameter} yet")
 
-        await self._hass.services.async_call(
-            state.domain,
-            service=svc,
-            context=state.context,
-            service_data=service_data,
-            blocking=False,
-        )
+        return svc, service_data
 
     async def apply_abs_adjustment(
         self, device_ids: list[str], parameter: str | None, amount: Any
@@ -575,29 +777,67 @@ class HassIface:
         Returns the list of successfully adjust device IDs.
         """
 
-        success_ids = []
+        # Resolve all states up front so a bad entity ID fails before any
+        # service call is dispatched.
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        states: list[core.State] = []
         for did in device_ids:
             state = self._hass.states.get(did)
             if not state:
                 raise ValueError(f"Entity '{did}' does not exist")
 
-            # We allow state changes when the value attribute is missing
-            current_value = state.attributes.get(parameter, 0.0)
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Changing %s %s from %s to %s",
+                    did,
+                    parameter,
+                    # We allow state changes when the value attribute is missing
+                    state.attributes.get(parameter, 0.0),
+                    amount,
+                )
+            states.append(state)
+
+        # Devices whose adjustment resolves to the identical service call are
+        # grouped; HA services accept an entity_id list, so each group costs
+        # one call and one schema validation instead of one per device.
+        groups: defaultdict[tuple[str, str, tuple], list[core.State]] = defaultdict(
+            list
+        )
+        for state in states:
+            svc, service_data = self._resolve_abs_adjustment(parameter, amount, state)
+            groups[(state.domain, svc, tuple(sorted(service_data.items())))].append(
+                state
+            )
 
-            _LOGGER.debug(
-                "Changing %s %s from %s to %s",
-                did,
-                parameter,
-                current_value,
-                amount,
+        calls = []
+        grouped_states: list[list[core.State]] = []
+        for (domain, svc, data_items), grp in groups.items():
+            service_data = dict(data_items)
+            service_data[CONF_ENTITY_ID] = [s.entity_id for s in grp]
+            calls.append(
+                self._hass.services.async_call(
+                    domain,
+                    service=svc,
+                    context=grp[0].context,
+                    service_data=service_data,
+                    blocking=False,
+                )
             )
-            try:
-                await self._apply_abs_adjustment(parameter, amount, state)
-            except vol.Invalid as ex:
+            grouped_states.append(grp)
+
+        # The remaining distinct calls are still dispatched concurrently.
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        success_ids = []
+        for grp, result in zip(grouped_states, results, strict=True):
+            ids = ", ".join(s.entity_id for s in grp)
+            if isinstance(result, vol.Invalid):
                 # Service schema validation failure. We probably missed setting something.
-                _LOGGER.exception("Failed to set %s for %s", parameter, did)
-                raise ValueError(f"Could not set {parameter} for {did}") from ex
-            success_ids.append(did)
+                _LOGGER.error("Failed to set %s for %s: %s", parameter, ids, result)
+                raise ValueError(f"Could not set {parameter} for {ids}") from result
+            if isinstance(result, Exception):
+                raise result
+            success_ids.extend(s.entity_id for s in grp)
 
         return success_ids
 
@@ -609,21 +849,26 @@ class HassIface:
         Returns the list of successfully adjust device IDs.
         """
 
-        success_ids = []
+        # Compute the per-device target values first; only valid adjustments
+        # are dispatched below. Relative targets generally differ per device,
+        # so the calls are not grouped the way apply_abs_adjustment does.
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        adjustments: list[tuple[core.State, str, dict[str, Any]]] = []
         for did in device_ids:
             state = self._hass.states.get(did)
             if not state:
                 raise ValueError(f"Entity '{did}' does not exist")
 
-            if parameter not in state.attributes:
+            # One lookup covers both the membership test and the value fetch.
+            current_value = state.attributes.get(parameter, _MISSING)
+            if current_value is _MISSING:
                 _LOGGER.info(
                     "Entity '%s' has no attribute '%s', will try to use state",
                     did,
                     parameter,
                 )
-
-            current_value = state.attributes.get(parameter, None)
-            if current_value is None:
+                current_value = 0.0
+            elif current_value is None:
                 current_value = 0.0
 
             if not isinstance(current_value, (float, int)):
@@ -637,61 +882,105 @@ class HassIface:
                 continue
 
             new_amount = current_value + amount
-            _LOGGER.debug(
-                "Changing %s %s from %s to %s",
-                did,
-                parameter,
-                state.attributes.get(parameter, None),
-                new_amount,
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Changing %s %s from %s to %s",
+                    did,
+                    parameter,
+                    current_value,
+                    new_amount,
+                )
+            svc, service_data = self._resolve_abs_adjustment(
+                parameter, new_amount, state
             )
-            try:
-                await self._apply_abs_adjustment(parameter, new_amount, state)
-            except vol.Invalid as ex:
+            service_data[CONF_ENTITY_ID] = state.entity_id
+            adjustments.append((state, svc, service_data))
+
+        results = await asyncio.gather(
+            *(
+                self._hass.services.async_call(
+                    state.domain,
+                    service=svc,
+                    context=state.context,
+                    service_data=service_data,
+                    blocking=False,
+                )
+                for state, svc, service_data in adjustments
+            ),
+            return_exceptions=True,
+        )
+
+        success_ids = []
+        for (state, _, _), result in zip(adjustments, results, strict=True):
+            if isinstance(result, vol.Invalid):
                 # Service schema validation failure. We probably missed setting something.
-                _LOGGER.exception("Failed to adjust %s for %s", parameter, did)
-                raise ValueError(f"Could not adjust {parameter} for {did}") from ex
-            success_ids.append(did)
+                _LOGGER.error(
+                    "Failed to adjust %s for %s: %s", parameter, state.entity_id, result
+                )
+                raise ValueError(
+                    f"Could not adjust {parameter} for {state.entity_id}"
+                ) from result
+            if isinstance(result, Exception):
+                raise result
+            success_ids.append(state.entity_id)
 
         return success_ids
 
     async def apply_action(self, action: str, device_ids: list[str]) -> int:
         """Make the requested adjustment to the specified devices."""
 
+        # Resolve all states up front so a bad entity ID fails before any
+        # service call is dispatched, then bucket by domain: HA services
+        # accept an entity_id list, so each domain costs one call and one
+        # schema validation instead of one per device.
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        buckets: defaultdict[str, list[core.State]] = defaultdict(list)
         for did in device_ids:
             state = self._hass.states.get(did)
 
             if state is None:
                 raise ValueError(f"No such device '{did}'")
 
-            _LOGGER.debug("Calling %s.%s on %s", state.domain, action, did)
-            # TODO: you can actually 'turn_on' all entities in an area or on
-            # a floor. It may make more sense to do things that way eventually
-            # if performance is poor.
-            # TODO: some service schemas require additional information.
-            service_data = {CONF_ENTITY_ID: did}
-            try:
-                # Apparently the "device automations" that define things like "open"
-                # and "close" for the `cover` domain don't actually map to services,
-                # so we get an error when attempting to open or close a cover. This
-                # may be true of other automations where the automation action does
-                # not match the service name.
-
-                # TODO: I have no idea how to actually trigger an automation action.
-                await self._hass.services.async_call(
-                    state.domain,
+            if debug_enabled:
+                _LOGGER.debug("Calling %s.%s on %s", state.domain, action, did)
+            buckets[state.domain].append(state)
+
+        # TODO: you can actually 'turn_on' all entities in an area or on
+        # a floor. It may make more sense to do things that way eventually
+        # if performance is poor.
+        # TODO: some service schemas require additional information.
+
+        # Apparently the "device automations" that define things like "open"
+        # and "close" for the `cover` domain don't actually map to services,
+        # so we get an error when attempting to open or close a cover. This
+        # may be true of other automations where the automation action does
+        # not match the service name.
+
+        # TODO: I have no idea how to actually trigger an automation action.
+        results = await asyncio.gather(
+            *(
+                self._hass.services.async_call(
+                    domain,
                     action,
-                    context=state.context,
-                    service_data=service_data,
+                    context=grp[0].context,
+                    service_data={CONF_ENTITY_ID: [s.entity_id for s in grp]},
                     blocking=False,
                 )
-            except ServiceNotFound as ex:
-                _LOGGER.exception("No action %s exists for %s", action, did)
-                raise ValueError(
-                    f"No action {action} exists for {state.domain}"
-                ) from ex
-            except vol.Invalid as ex:
+                for domain, grp in buckets.items()
+            ),
+            return_exceptions=True,
+        )
+
+        for (domain, grp), result in zip(buckets.items(), results, strict=True):
+            if isinstance(result, ServiceNotFound):
+                _LOGGER.error("No action %s exists for %s", action, domain)
+                raise ValueError(f"No action {action} exists for {domain}") from result
+            if isinstance(result, vol.Invalid):
                 # Service schema validation failure. We probably missed setting something.
-                _LOGGER.exception("Failed to call %s on %s", action, did)
-                raise ValueError(f"Could not {action} {did}") from ex
+                ids = ", ".join(s.entity_id for s in grp)
+                _LOGGER.error("Failed to call %s on %s", action, ids)
+                raise ValueError(f"Could not {action} {ids}") from result
+            if isinstance(result, Exception):
+                raise result
 
         return device_ids